@@ -24,6 +24,10 @@ INSTALLED_APPS = [
 
 USE_S3_MEDIA = os.getenv("DJANGO_USE_S3_MEDIA", "0") == "1"
 
+# When enabled, CarImage.save() stores the raw upload and a background
+# task produces the optimised variant instead of blocking the request.
+CAR_IMAGE_ASYNC_OPTIMISE = os.getenv("DJANGO_CAR_IMAGE_ASYNC_OPTIMISE", "0") == "1"
+
 if USE_S3_MEDIA:
     INSTALLED_APPS.append("storages")
 
@@ -31,6 +35,7 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -66,9 +71,39 @@ DATABASES = {
         "PASSWORD": os.getenv("DJANGO_DB_PASSWORD", ""),
         "HOST": os.getenv("DJANGO_DB_HOST", ""),
         "PORT": os.getenv("DJANGO_DB_PORT", ""),
+        # Keep connections open between requests instead of paying the
+        # connect/auth handshake on every request.
+        "CONN_MAX_AGE": int(os.getenv("DJANGO_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Pool options are only consumed by pooling engines such as
+# dj_db_conn_pool.backends.postgresql (select via DJANGO_DB_ENGINE).
+if "dj_db_conn_pool" in DATABASES["default"]["ENGINE"]:
+    DATABASES["default"]["POOL_OPTIONS"] = {
+        "POOL_SIZE": int(os.getenv("DB_POOL_SIZE", "10")),
+        "MAX_OVERFLOW": int(os.getenv("DB_POOL_OVERFLOW", "10")),
+        "RECYCLE": 3600,
+    }
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "avtofamily",
+        }
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -99,10 +134,10 @@ MEDIA_ROOT = Path(os.getenv("DJANGO_MEDIA_ROOT", BASE_DIR / "media"))
 
 STORAGES = {
     "default": {
+        # No explicit location: FileSystemStorage then falls back to
+        # MEDIA_ROOT lazily, so test overrides of MEDIA_ROOT actually
+        # redirect file writes instead of leaking into backend/media.
         "BACKEND": "django.core.files.storage.FileSystemStorage",
-        "OPTIONS": {
-            "location": str(MEDIA_ROOT),
-        },
     },
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
@@ -110,6 +145,9 @@ STORAGES = {
 }
 
 if USE_S3_MEDIA:
+    # Credentials, bucket and client tuning are resolved lazily by
+    # inventory.storage.s3_storage_options() on first media access; only
+    # what MEDIA_URL needs is read here.
     AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME")
     if not AWS_STORAGE_BUCKET_NAME:
         raise RuntimeError("AWS_STORAGE_BUCKET_NAME must be set when DJANGO_USE_S3_MEDIA=1")
@@ -118,23 +156,7 @@ if USE_S3_MEDIA:
     AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL")
     AWS_S3_CUSTOM_DOMAIN = os.getenv("AWS_S3_CUSTOM_DOMAIN")
 
-    AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-    AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-
-    AWS_DEFAULT_ACL = None
-    AWS_QUERYSTRING_AUTH = False
-    AWS_S3_FILE_OVERWRITE = False
-    AWS_S3_SIGNATURE_VERSION = os.getenv("AWS_S3_SIGNATURE_VERSION", "s3v4")
-
-    STORAGES["default"] = {
-        "BACKEND": "storages.backends.s3boto3.S3Boto3Storage",
-        "OPTIONS": {
-            "bucket_name": AWS_STORAGE_BUCKET_NAME,
-            "region_name": AWS_S3_REGION_NAME,
-            "endpoint_url": AWS_S3_ENDPOINT_URL,
-            "custom_domain": AWS_S3_CUSTOM_DOMAIN,
-        },
-    }
+    STORAGES["default"] = {"BACKEND": "inventory.storage.CachedS3Storage"}
 
     if AWS_S3_CUSTOM_DOMAIN:
         MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN.rstrip('/')}/"
@@ -142,15 +164,14 @@ if USE_S3_MEDIA:
         MEDIA_URL = f"{AWS_S3_ENDPOINT_URL.rstrip('/')}/{AWS_STORAGE_BUCKET_NAME}/"
     else:
         MEDIA_URL = f"https://{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/"
-STATIC_URL = "static/"
-STATIC_ROOT = BASE_DIR / "staticfiles"
-
-MEDIA_URL = "media/"
-MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "inventory.api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.OrderingFilter",
@@ -7,6 +7,14 @@ from django.utils.html import format_html
 from . import models
 
 
+class CarFeatureInline(admin.TabularInline):
+    # The M2M uses an explicit through model, so the admin edits it via
+    # an inline rather than a widget on the Car form.
+    model = models.CarFeature
+    extra = 1
+    autocomplete_fields = ("feature",)
+
+
 class CarImageInline(admin.TabularInline):
     model = models.CarImage
     extra = 1
@@ -21,7 +29,6 @@ class CarImageInline(admin.TabularInline):
                 obj.image.url,
             )
         return "—"
-    fields = ("image", "caption", "is_primary", "ordering")
 
 
 @admin.register(models.Car)
@@ -30,8 +37,6 @@ class CarAdmin(admin.ModelAdmin):
         "title",
         "make",
         "model",
-        "brand",
-        "model_name",
         "manufacture_year",
         "price",
         "status",
@@ -41,8 +46,6 @@ class CarAdmin(admin.ModelAdmin):
         "status",
         "make",
         "model",
-        "brand",
-        "model_name",
         "manufacture_year",
         "fuel_type",
         "body_type",
@@ -51,16 +54,13 @@ class CarAdmin(admin.ModelAdmin):
         "title",
         "make__title",
         "model__title",
-        "brand",
-        "model_name",
         "vin",
         "description",
     )
-    inlines = [CarImageInline]
-    autocomplete_fields = ("make", "model", "features")
-    prepopulated_fields = {"slug": ("brand", "model_name", "manufacture_year")}
-    autocomplete_fields = ("features",)
-    filter_horizontal = ("features",)
+    inlines = [CarFeatureInline, CarImageInline]
+    list_select_related = ("make", "model")
+    autocomplete_fields = ("make", "model")
+    prepopulated_fields = {"slug": ("title",)}
     fieldsets = (
         ("Основная информация", {
             "fields": (
@@ -70,8 +70,6 @@ class CarAdmin(admin.ModelAdmin):
                 "status",
                 "make",
                 "model",
-                "brand",
-                "model_name",
                 "generation",
                 "manufacture_year",
                 "price",
@@ -91,7 +89,6 @@ class CarAdmin(admin.ModelAdmin):
                 "engine_power_hp",
                 "owners_count",
                 "customs_cleared",
-                "features",
             )
         }),
         ("Контакты", {
@@ -160,6 +157,7 @@ class PublicationLogAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("channel", "status")
+    list_select_related = ("car__make", "car__model", "channel")
     search_fields = ("car__title", "external_id", "error_message")
     autocomplete_fields = ("car", "channel")
     readonly_fields = ("created_at", "updated_at")
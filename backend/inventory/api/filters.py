@@ -0,0 +1,110 @@
+"""Filtersets for inventory API endpoints.
+
+Declaring these once at import time avoids django-filter rebuilding a
+``FilterSet`` class from ``filterset_fields`` via model introspection on
+every request.
+"""
+from __future__ import annotations
+
+import functools
+import operator
+
+import django_filters
+from django.db import connections
+from rest_framework import filters as drf_filters
+
+from .. import models
+
+#: Columns covered by the full-text expression index (migration 0012). The
+#: SearchVector below must stay in sync with that index expression. The
+#: denormalised make_title/model_title columns stand in for the joined
+#: make__title/model__title that the ILIKE fallback searches.
+CAR_SEARCH_COLUMNS = ("title", "vin", "description", "make_title", "model_title")
+
+
+class CarSearchFilter(drf_filters.SearchFilter):
+    """Index-backed full-text search for cars on PostgreSQL.
+
+    DRF's default ``SearchFilter`` expands ``?search=`` into chained
+    ``ILIKE '%…%'`` predicates over five columns, a sequential scan that
+    grows with the table. On PostgreSQL we match a ``to_tsvector``
+    expression over the local car columns instead, which the GIN
+    expression index serves; other backends (SQLite in tests) keep the
+    default behaviour.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or connections[queryset.db or "default"].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        # No relevance ranking: cursor pagination re-applies the view's
+        # -created_at ordering regardless, so search results are newest
+        # first by design and computing ts_rank per row would be wasted.
+        vector = SearchVector(*CAR_SEARCH_COLUMNS, config="russian")
+        query = functools.reduce(
+            operator.and_, (SearchQuery(term, config="russian") for term in terms)
+        )
+        return queryset.annotate(search=vector).filter(search=query)
+
+
+class CachedOrderingFilter(drf_filters.OrderingFilter):
+    """``OrderingFilter`` that memoizes ``get_valid_fields`` per view class.
+
+    Every viewset here declares ``ordering_fields`` as a static class
+    attribute, so the valid-field reflection walk produces the same result
+    for every request on a given view; compute it once per process.
+    """
+
+    _valid_fields_cache: dict[type, list[tuple[str, str]]] = {}
+
+    def get_valid_fields(self, queryset, view, context=None):
+        view_class = view.__class__
+        if getattr(view_class, "ordering_fields", None) == "__all__":
+            return super().get_valid_fields(queryset, view, context or {})
+        try:
+            return self._valid_fields_cache[view_class]
+        except KeyError:
+            fields = super().get_valid_fields(queryset, view, context or {})
+            self._valid_fields_cache[view_class] = fields
+            return fields
+
+
+class CarFilter(django_filters.FilterSet):
+    price_min = django_filters.NumberFilter(field_name="price", lookup_expr="gte")
+    price_max = django_filters.NumberFilter(field_name="price", lookup_expr="lte")
+    mileage_min = django_filters.NumberFilter(field_name="mileage_km", lookup_expr="gte")
+    mileage_max = django_filters.NumberFilter(field_name="mileage_km", lookup_expr="lte")
+    year_min = django_filters.NumberFilter(
+        field_name="manufacture_year", lookup_expr="gte"
+    )
+    year_max = django_filters.NumberFilter(
+        field_name="manufacture_year", lookup_expr="lte"
+    )
+
+    class Meta:
+        model = models.Car
+        fields = [
+            "status",
+            "make",
+            "model",
+            "manufacture_year",
+            "fuel_type",
+            "body_type",
+            "drive_type",
+            "customs_cleared",
+        ]
+
+
+class CarModelFilter(django_filters.FilterSet):
+    class Meta:
+        model = models.CarModel
+        fields = ["make"]
+
+
+class PublicationLogFilter(django_filters.FilterSet):
+    class Meta:
+        model = models.PublicationLog
+        fields = ["channel", "status", "car"]
@@ -0,0 +1,19 @@
+"""Pagination classes for inventory API endpoints."""
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination over the ``created_at`` timeline.
+
+    Unlike ``PageNumberPagination`` this never issues ``COUNT(*)`` or
+    ``OFFSET``; deep pages stay an index seek plus one page-sized fetch.
+    The pk tie-breaker makes the ordering unique, so rows created in the
+    same clock tick (bulk imports) are never skipped or repeated across
+    page boundaries; the (-created_at, -id) indexes serve the seek.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    cursor_query_param = "cursor"
@@ -0,0 +1,31 @@
+"""Response renderers for inventory API endpoints."""
+from __future__ import annotations
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerated encoder
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer that encodes with orjson when it is installed.
+
+    Encoding is the dominant CPU cost of large list responses once the
+    queries are fast; orjson is several times quicker than the stdlib
+    encoder on the nested car payloads. When orjson is unavailable (or a
+    payload contains something it cannot encode) the renderer falls back
+    to DRF's default implementation, so the dependency stays optional.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if (renderer_context or {}).get("indent"):
+            # The browsable API asks for pretty-printed output.
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
@@ -1,9 +1,51 @@
 """Serializers for inventory API endpoints."""
 from __future__ import annotations
 
+from django.core.cache import cache
+from django.utils import timezone
 from rest_framework import serializers
 
 from .. import models
+from ..signals import FEATURE_IDS_CACHE_KEY
+
+#: How long the validated Feature id set may be served from the cache.
+FEATURE_IDS_CACHE_TTL = 60
+
+
+def feature_id_set() -> set[int]:
+    return cache.get_or_set(
+        FEATURE_IDS_CACHE_KEY,
+        lambda: set(models.Feature.objects.values_list("id", flat=True)),
+        FEATURE_IDS_CACHE_TTL,
+    )
+
+
+class FeaturePrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """PK validation against a cached id set instead of per-request SELECTs.
+
+    Feature rows change rarely, but every car write re-validated each
+    submitted id against the database. Membership is checked against a
+    short-TTL cached id set (invalidated by the signals module on feature
+    changes) and a pk-only shell instance is returned — all the M2M
+    ``set()`` call in ``CarSerializer`` needs.
+    """
+
+    def get_queryset(self):
+        return models.Feature.objects.only("id")
+
+    def to_internal_value(self, data):
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if pk not in feature_id_set():
+            self.fail("does_not_exist", pk_value=pk)
+        feature = models.Feature(pk=pk)
+        # Mark the shell as a loaded row so relation assignment passes the
+        # ORM's cross-database checks.
+        feature._state.adding = False
+        feature._state.db = self.get_queryset().db
+        return feature
 
 
 class MakeSerializer(serializers.ModelSerializer):
@@ -45,6 +87,11 @@ class FeatureSerializer(serializers.ModelSerializer):
 
 
 class CarImageSerializer(serializers.ModelSerializer):
+    # Writable so update payloads can reference existing rows; the default
+    # read-only pk field would be stripped from validated_data and every
+    # sync would delete and re-create the whole gallery.
+    id = serializers.IntegerField(required=False)
+
     class Meta:
         model = models.CarImage
         fields = [
@@ -59,13 +106,57 @@ class CarImageSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
 
+class CarImageRowsField(serializers.Field):
+    """Plain-dict read path for ``Car.images``.
+
+    List responses serialize 100+ images per page; running a seven-field
+    ``ModelSerializer`` per row makes DRF's field-binding loop the hot
+    path. This field renders prefetched rows (``_image_rows``, see
+    ``CarViewSet``) into dicts directly and delegates writes to
+    ``CarImageSerializer`` so validation behaviour is unchanged.
+    """
+
+    _datetime = serializers.DateTimeField()
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("required", False)
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        return instance
+
+    def to_representation(self, car):
+        rows = getattr(car, "_image_rows", None)
+        if rows is None:
+            rows = car.images.all()
+        request = self.context.get("request")
+        result = []
+        for image in rows:
+            url = image.image.url if image.image else None
+            if url and request is not None:
+                url = request.build_absolute_uri(url)
+            result.append(
+                {
+                    "id": image.id,
+                    "image": url,
+                    "caption": image.caption,
+                    "is_primary": image.is_primary,
+                    "ordering": image.ordering,
+                    "created_at": self._datetime.to_representation(image.created_at),
+                    "updated_at": self._datetime.to_representation(image.updated_at),
+                }
+            )
+        return result
+
+    def to_internal_value(self, data):
+        serializer = CarImageSerializer(data=data, many=True)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+
 class CarSerializer(serializers.ModelSerializer):
-    images = CarImageSerializer(many=True, required=False)
-    features = serializers.PrimaryKeyRelatedField(
-        many=True,
-        queryset=models.Feature.objects.all(),
-        required=False,
-    )
+    images = CarImageRowsField()
+    features = FeaturePrimaryKeyRelatedField(many=True, required=False)
     make = MakeSerializer(read_only=True)
     make_id = serializers.PrimaryKeyRelatedField(
         queryset=models.Make.objects.all(),
@@ -90,8 +181,6 @@ class CarSerializer(serializers.ModelSerializer):
             "make_id",
             "model",
             "model_id",
-            "brand",
-            "model_name",
             "generation",
             "manufacture_year",
             "price",
@@ -124,7 +213,6 @@ class CarSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["status_changed_at", "published_at", "created_at", "updated_at"]
 
     def create(self, validated_data):
         images_data = validated_data.pop("images", [])
@@ -155,19 +243,61 @@ class CarSerializer(serializers.ModelSerializer):
         return attrs
 
     def _sync_images(self, car: models.Car, images_data: list[dict]) -> None:
-        existing = {img.id: img for img in car.images.all()}
-        keep_ids = []
-        for image in images_data:
-            image_id = image.get("id")
+        existing = car.images.in_bulk()
+        to_update: list[models.CarImage] = []
+        to_create: list[models.CarImage] = []
+        now = timezone.now()
+
+        for image_data in images_data:
+            image_id = image_data.get("id")
             if image_id and image_id in existing:
-                for attr, value in image.items():
+                image = existing[image_id]
+                for attr, value in image_data.items():
                     if attr != "id":
-                        setattr(existing[image_id], attr, value)
-                existing[image_id].save()
-                keep_ids.append(image_id)
+                        setattr(image, attr, value)
+                image.updated_at = now
+                to_update.append(image)
             else:
-                models.CarImage.objects.create(car=car, **image)
-        to_delete = [img_id for img_id in existing if img_id not in keep_ids]
+                # Unknown ids fall through to creation; never hand the pk
+                # to the new row.
+                image_data.pop("id", None)
+                to_create.append(models.CarImage(car=car, **image_data))
+
+        # bulk_create/bulk_update skip CarImage.save(), so run the upload
+        # optimisation explicitly before writing.
+        for image in (*to_update, *to_create):
+            image.optimise_pending_upload()
+
+        # Resolve the single-primary invariant before the bulk writes so
+        # the partial unique constraint is never violated mid-batch; the
+        # last primary image in the payload wins, matching save() order.
+        primaries = [image for image in (*to_update, *to_create) if image.is_primary]
+        if primaries:
+            keeper = primaries[-1]
+            for image in primaries[:-1]:
+                image.is_primary = False
+            car.images.filter(is_primary=True).exclude(pk=keeper.pk).update(
+                is_primary=False
+            )
+
+        if to_update:
+            models.CarImage.objects.bulk_update(
+                to_update,
+                fields=[
+                    "image",
+                    "caption",
+                    "is_primary",
+                    "ordering",
+                    "optimised",
+                    "updated_at",
+                ],
+                batch_size=200,
+            )
+        if to_create:
+            models.CarImage.objects.bulk_create(to_create, batch_size=200)
+
+        keep_ids = {image.pk for image in to_update}
+        to_delete = [image_id for image_id in existing if image_id not in keep_ids]
         if to_delete:
             models.CarImage.objects.filter(id__in=to_delete).delete()
 
@@ -1,46 +1,111 @@
 """REST API endpoints for the inventory domain."""
 from __future__ import annotations
 
-from django.db.models import Prefetch
+import hashlib
+
+from django.db.models import Count, Max, Prefetch
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.vary import vary_on_headers
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, viewsets
 
 from .. import models
 from . import serializers
+from .filters import (
+    CachedOrderingFilter,
+    CarFilter,
+    CarModelFilter,
+    CarSearchFilter,
+    PublicationLogFilter,
+)
+from .pagination import CreatedAtCursorPagination
+
+#: How long list responses for slow-changing reference data stay cached.
+REFERENCE_CACHE_TTL = 60 * 5
+
+_CAR_RELATION_FIELDS = {"images", "features", "make", "model", "make_id", "model_id"}
+
+#: Concrete Car columns CarSerializer actually reads, plus the few columns
+#: needed from the joined make/model rows. Keeping the SELECT aligned with
+#: the serializer avoids shipping unused columns through the DB driver.
+CAR_ONLY_FIELDS = tuple(
+    name
+    for name in serializers.CarSerializer.Meta.fields
+    if name not in _CAR_RELATION_FIELDS
+) + (
+    "make_title",
+    "model_title",
+    "make__title",
+    "make__slug",
+    "model__title",
+    "model__slug",
+    "model__make__title",
+    "model__make__slug",
+)
+
+
+class CachedListMixin:
+    """Serve list responses from the cache framework.
+
+    Intended for reference data (makes, models, features, channels) that
+    changes rarely; entries expire via TTL rather than explicit
+    invalidation, so keep the timeout short.
+    """
+
+    @method_decorator(cache_page(REFERENCE_CACHE_TTL))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class CacheHeadersListMixin:
+    """Emit shared-cache headers on list responses.
+
+    Lets a CDN or reverse proxy in front of the API absorb reference-data
+    traffic: browsers may reuse a response for a minute, shared caches for
+    ten, with revalidation varying on content negotiation headers.
+    """
+
+    @method_decorator(cache_control(public=True, max_age=60, s_maxage=600))
+    @method_decorator(vary_on_headers("Accept", "Accept-Language"))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
 
-class MakeViewSet(viewsets.ModelViewSet):
+class MakeViewSet(CacheHeadersListMixin, CachedListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = models.Make.objects.all()
     serializer_class = serializers.MakeSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.SearchFilter, CachedOrderingFilter]
     search_fields = ["title", "slug"]
     ordering_fields = ["title"]
     ordering = ["title"]
 
 
-class CarModelViewSet(viewsets.ModelViewSet):
+class CarModelViewSet(CacheHeadersListMixin, CachedListMixin, viewsets.ModelViewSet):
     queryset = models.CarModel.objects.select_related("make").all()
     serializer_class = serializers.CarModelSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter, DjangoFilterBackend]
-    filterset_fields = ["make"]
+    filter_backends = [filters.SearchFilter, CachedOrderingFilter, DjangoFilterBackend]
+    filterset_class = CarModelFilter
     search_fields = ["title", "slug", "make__title"]
     ordering_fields = ["title", "make__title"]
     ordering = ["make__title", "title"]
 
 
-class FeatureViewSet(viewsets.ModelViewSet):
+class FeatureViewSet(CacheHeadersListMixin, CachedListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = models.Feature.objects.select_related("category").all()
     serializer_class = serializers.FeatureSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.SearchFilter, CachedOrderingFilter]
     search_fields = ["title", "slug"]
     ordering_fields = ["title", "category__title"]
     ordering = ["category__title", "title"]
 
 
-class PublicationChannelViewSet(viewsets.ModelViewSet):
+class PublicationChannelViewSet(CacheHeadersListMixin, CachedListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = models.PublicationChannel.objects.all()
     serializer_class = serializers.PublicationChannelSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.SearchFilter, CachedOrderingFilter]
     search_fields = ["title", "slug"]
     ordering_fields = ["title", "active"]
     ordering = ["title"]
@@ -53,42 +118,101 @@ class PublicationLogViewSet(viewsets.ModelViewSet):
         .all()
     )
     serializer_class = serializers.PublicationLogSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["channel", "status", "car"]
+    pagination_class = CreatedAtCursorPagination
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, CachedOrderingFilter]
+    filterset_class = PublicationLogFilter
     search_fields = ["external_id", "error_message", "car__title"]
     ordering_fields = ["created_at", "published_at"]
+    ordering = ["-created_at", "-id"]
 
 
 class CarViewSet(viewsets.ModelViewSet):
     queryset = (
-        models.Car.objects.select_related("make", "model")
-        models.Car.objects.select_related()
+        models.Car.objects.select_related("make", "model__make")
+        .only(*CAR_ONLY_FIELDS)
         .prefetch_related(
             "features",
-            Prefetch("images", queryset=models.CarImage.objects.order_by("ordering", "id")),
+            Prefetch(
+                "images",
+                queryset=models.CarImage.objects.order_by("ordering", "id").only(
+                    "id",
+                    "car",
+                    "image",
+                    "caption",
+                    "is_primary",
+                    "ordering",
+                    "created_at",
+                    "updated_at",
+                ),
+                to_attr="_image_rows",
+            ),
         )
         .all()
     )
     serializer_class = serializers.CarSerializer
+    pagination_class = CreatedAtCursorPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
-    filterset_fields = [
-        "status",
-        "make",
-        "model",
-        "brand",
-        "model_name",
-        "manufacture_year",
-        "fuel_type",
-        "body_type",
-        "drive_type",
-        "customs_cleared",
+        CarSearchFilter,
+        CachedOrderingFilter,
     ]
+    filterset_class = CarFilter
     search_fields = ["title", "make__title", "model__title", "vin", "description"]
-    search_fields = ["title", "brand", "model_name", "vin", "description"]
     ordering_fields = ["created_at", "manufacture_year", "price", "mileage_km"]
-    ordering = ["-created_at"]
+    # Cursor pagination defers to the ordering filter, which falls back to
+    # this default — it must carry the pk tie-breaker itself or ties on
+    # created_at (bulk imports) can skip/repeat rows across pages.
+    ordering = ["-created_at", "-id"]
+
+    def list(self, request, *args, **kwargs):
+        etag = self._list_etag(request)
+        if etag is not None:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        if etag is not None:
+            response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        updated_at = (
+            self.get_queryset()
+            .filter(pk=self.kwargs[self.lookup_field])
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        etag = self._make_etag(updated_at.isoformat()) if updated_at else None
+        if etag is not None:
+            # Whole seconds, matching the http_date truncation below —
+            # If-Modified-Since carries no sub-second precision, so a
+            # float timestamp would compare "modified" on every request.
+            not_modified = get_conditional_response(
+                request, etag=etag, last_modified=int(updated_at.timestamp())
+            )
+            if not_modified is not None:
+                return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        if etag is not None:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(updated_at.timestamp())
+        return response
+
+    def _list_etag(self, request) -> str | None:
+        """Cheap aggregate fingerprint of the filtered list queryset."""
+
+        stats = self.filter_queryset(self.get_queryset()).aggregate(
+            latest=Max("updated_at"), total=Count("id")
+        )
+        if stats["latest"] is None:
+            return None
+        return self._make_etag(
+            f"{stats['latest'].isoformat()}:{stats['total']}:{request.GET.urlencode()}"
+        )
+
+    @staticmethod
+    def _make_etag(raw: str) -> str:
+        return quote_etag(hashlib.blake2b(raw.encode(), digest_size=16).hexdigest())
 
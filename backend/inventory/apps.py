@@ -9,3 +9,6 @@ class InventoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "inventory"
     verbose_name = "Каталог автомобилей"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
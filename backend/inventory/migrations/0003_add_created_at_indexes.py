@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0002_add_make_model_lookups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['-created_at', 'id'], name='inventory_c_created_b492d4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publicationlog',
+            index=models.Index(fields=['-created_at', 'id'], name='inventory_p_created_bdaba1_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""GIN expression index backing CarSearchFilter's full-text search.
+
+Written as vendor-gated SQL because the expression index (and ``russian``
+text-search configuration) only exists on PostgreSQL; SQLite development
+and test databases fall back to ILIKE search and need no index.
+"""
+from django.db import migrations
+
+# Must stay in sync with SearchVector(*CAR_SEARCH_COLUMNS, config="russian")
+# in inventory/api/filters.py so the planner can use the index.
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS car_search_vector_idx ON inventory_car USING GIN (
+    to_tsvector(
+        'russian',
+        COALESCE(title, '') || ' ' || COALESCE(vin, '') || ' ' || COALESCE(description, '')
+    )
+)
+"""
+
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS car_search_vector_idx"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_add_created_at_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_car_search_vector_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['status', '-created_at'], name='car_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['make', 'model', '-created_at'], name='car_make_model_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-created_at'], name='car_published_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publicationlog',
+            index=models.Index(fields=['channel', 'status', '-created_at'], name='publog_chan_status_created_idx'),
+        ),
+    ]
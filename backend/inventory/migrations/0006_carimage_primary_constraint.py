@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0005_add_list_view_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='carimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('car',), name='uniq_primary_car_image'),
+        ),
+    ]
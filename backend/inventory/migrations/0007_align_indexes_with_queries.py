@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_carimage_primary_constraint'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='car',
+            name='inventory_c_status_ad60d3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='car',
+            name='inventory_c_make_id_2376fa_idx',
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['make', 'model', 'status'], name='car_make_model_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publicationlog',
+            index=models.Index(fields=['car', '-created_at'], name='publog_car_created_idx'),
+        ),
+    ]
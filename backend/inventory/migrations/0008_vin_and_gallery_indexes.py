@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_align_indexes_with_queries'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(condition=models.Q(('vin', ''), _negated=True), fields=['vin'], name='car_vin_nonempty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='carimage',
+            index=models.Index(fields=['car', 'ordering', 'id'], name='carimg_gallery_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:45
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_titles(apps, schema_editor):
+    Car = apps.get_model("inventory", "Car")
+    Make = apps.get_model("inventory", "Make")
+    CarModel = apps.get_model("inventory", "CarModel")
+
+    Car.objects.update(
+        make_title=Subquery(
+            Make.objects.filter(pk=OuterRef("make_id")).values("title")[:1]
+        ),
+        model_title=Subquery(
+            CarModel.objects.filter(pk=OuterRef("model_id")).values("title")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_vin_and_gallery_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='car',
+            name='make_title',
+            field=models.CharField(blank=True, editable=False, max_length=80, verbose_name='Марка (текст)'),
+        ),
+        migrations.AddField(
+            model_name='car',
+            name='model_title',
+            field=models.CharField(blank=True, editable=False, max_length=80, verbose_name='Модель (текст)'),
+        ),
+        migrations.RunPython(backfill_titles, migrations.RunPython.noop),
+    ]
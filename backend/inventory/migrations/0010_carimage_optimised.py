@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-30 17:49
+
+from django.db import migrations, models
+
+
+def mark_existing_optimised(apps, schema_editor):
+    # Rows that exist already went through the synchronous save() pipeline.
+    CarImage = apps.get_model("inventory", "CarImage")
+    CarImage.objects.update(optimised=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0009_car_denormalised_titles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='carimage',
+            name='optimised',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Оптимизировано'),
+        ),
+        migrations.RunPython(mark_existing_optimised, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Swap Car.features to an explicit through model.
+
+    The model points at the table the auto-created M2M already uses
+    (``inventory_car_features``, same columns), so the CreateModel and
+    AlterField run as state-only operations and existing rows survive.
+    Only the new (feature, car) index touches the database.
+    """
+
+    dependencies = [
+        ('inventory', '0010_carimage_optimised'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='CarFeature',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('car', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='inventory.car', verbose_name='Автомобиль')),
+                        ('feature', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='inventory.feature', verbose_name='Особенность')),
+                    ],
+                    options={
+                        'db_table': 'inventory_car_features',
+                        'unique_together': {('car', 'feature')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='car',
+                    name='features',
+                    field=models.ManyToManyField(blank=True, related_name='cars', through='inventory.CarFeature', to='inventory.feature', verbose_name='Особенности'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='carfeature',
+            index=models.Index(fields=['feature', 'car'], name='carfeat_feature_car_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+"""Extend the car full-text index over the denormalised title columns.
+
+The index from 0004 covered title/vin/description only, so on PostgreSQL
+``?search=`` missed make and model names that the SQLite ILIKE fallback
+matched. Now that 0009 denormalised make_title/model_title onto the car
+table, the expression can include them; a separate migration (rather than
+editing 0004) because those columns do not exist at 0004's point in the
+sequence.
+"""
+from django.db import migrations
+
+# Must stay in sync with SearchVector(*CAR_SEARCH_COLUMNS, config="russian")
+# in inventory/api/filters.py so the planner can use the index.
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS car_search_vector_idx ON inventory_car USING GIN (
+    to_tsvector(
+        'russian',
+        COALESCE(title, '') || ' ' || COALESCE(vin, '') || ' ' || COALESCE(description, '')
+        || ' ' || COALESCE(make_title, '') || ' ' || COALESCE(model_title, '')
+    )
+)
+"""
+
+OLD_CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS car_search_vector_idx ON inventory_car USING GIN (
+    to_tsvector(
+        'russian',
+        COALESCE(title, '') || ' ' || COALESCE(vin, '') || ' ' || COALESCE(description, '')
+    )
+)
+"""
+
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS car_search_vector_idx"
+
+
+def recreate_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+    schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def restore_old_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+    schema_editor.execute(OLD_CREATE_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0011_carfeature_explicit_through"),
+    ]
+
+    operations = [
+        migrations.RunPython(recreate_index, restore_old_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-30 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0012_search_vector_make_model'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='car',
+            name='inventory_c_created_b492d4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='publicationlog',
+            name='inventory_p_created_bdaba1_idx',
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['-created_at', '-id'], name='inventory_c_created_19ed68_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publicationlog',
+            index=models.Index(fields=['-created_at', '-id'], name='inventory_p_created_d16496_idx'),
+        ),
+    ]
@@ -1,8 +1,11 @@
 """Database models describing vehicles and publication workflow."""
 from __future__ import annotations
 
+import secrets
+
+from django.conf import settings
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -33,6 +36,13 @@ class Make(models.Model):
     def __str__(self) -> str:
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Slug is computed once here so downstream writers (Car.save,
+        # bulk_import) can use it verbatim without re-slugifying titles.
+        if not self.slug:
+            self.slug = slugify(self.title)
+        super().save(*args, **kwargs)
+
 
 class CarModel(models.Model):
     """Represents a specific model produced by a make."""
@@ -62,6 +72,11 @@ class CarModel(models.Model):
     def __str__(self) -> str:
         return f"{self.make.title} {self.title}"
 
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = slugify(self.title)
+        super().save(*args, **kwargs)
+
 
 class FeatureCategory(models.Model):
     """Lookup table grouping car features."""
@@ -99,6 +114,63 @@ class Feature(models.Model):
         return self.title
 
 
+class CarQuerySet(models.QuerySet):
+    def with_features(self):
+        """Prefetch the feature M2M (with categories) for feature-heavy reads."""
+
+        return self.prefetch_related("features__category")
+
+    def set_status(self, status):
+        """Flip ``status`` for every row in the queryset with one UPDATE.
+
+        Bypasses :meth:`Car.save` entirely, so the timestamps save() would
+        maintain are set here: ``status_changed_at`` and ``updated_at`` get
+        the same instant, and publishing fills ``published_at`` only where
+        it is still empty. Returns the number of rows updated.
+        """
+
+        now = timezone.now()
+        updates = {"status": status, "status_changed_at": now, "updated_at": now}
+        if status == Car.Status.PUBLISHED:
+            updates["published_at"] = models.Case(
+                models.When(published_at__isnull=True, then=models.Value(now)),
+                default=models.F("published_at"),
+            )
+        return self.update(**updates)
+
+
+class CarManager(models.Manager.from_queryset(CarQuerySet)):
+    def get_queryset(self):
+        # Car reads almost always render make/model; JOIN them by default
+        # so ad-hoc loops and admin pages don't degrade into per-row
+        # lookups. Views with tighter needs still override with .only().
+        return super().get_queryset().select_related("make", "model")
+
+    def bulk_import(self, cars, batch_size=1000):
+        """Insert many cars through ``bulk_create`` in a single transaction.
+
+        ``bulk_create`` skips :meth:`Car.save`, so the columns save()
+        computes — slug, ``published_at`` and the denormalised titles — are
+        prefilled in Python here. Callers must assign the ``make`` and
+        ``model`` relations as instances. Returns the created objects.
+        """
+
+        cars = list(cars)
+        now = timezone.now()
+        for car in cars:
+            if not car.slug:
+                suffix = car.vin or secrets.token_urlsafe(6)
+                car.slug = slugify(f"{car.make.slug}-{car.model.slug}-{suffix}")
+            if car.status == Car.Status.PUBLISHED and not car.published_at:
+                car.published_at = now
+            if not car.make_title:
+                car.make_title = car.make.title
+            if not car.model_title:
+                car.model_title = car.model.title
+        with transaction.atomic():
+            return self.bulk_create(cars, batch_size=batch_size)
+
+
 class Car(TimestampedModel):
     """Represents a car that can be published to different channels."""
 
@@ -124,8 +196,12 @@ class Car(TimestampedModel):
         related_name="cars",
         verbose_name="Модель",
     )
-    brand = models.CharField("Марка", max_length=80)
-    model_name = models.CharField("Модель", max_length=80)
+    make_title = models.CharField(
+        "Марка (текст)", max_length=80, blank=True, editable=False
+    )
+    model_title = models.CharField(
+        "Модель (текст)", max_length=80, blank=True, editable=False
+    )
     generation = models.CharField("Поколение", max_length=80, blank=True)
     manufacture_year = models.PositiveSmallIntegerField("Год выпуска")
     price = models.DecimalField(
@@ -184,80 +260,160 @@ class Car(TimestampedModel):
         related_name="cars",
         verbose_name="Особенности",
         blank=True,
+        through="CarFeature",
     )
 
+    objects = CarManager()
+
     class Meta:
         verbose_name = "Автомобиль"
         verbose_name_plural = "Автомобили"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["status"]),
-            models.Index(fields=["make", "model"]),
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(
+                fields=["status", "-created_at"], name="car_status_created_idx"
+            ),
+            models.Index(
+                fields=["make", "model", "status"], name="car_make_model_status_idx"
+            ),
+            models.Index(
+                fields=["make", "model", "-created_at"],
+                name="car_make_model_created_idx",
+            ),
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status="published"),
+                name="car_published_created_idx",
+            ),
+            models.Index(
+                fields=["vin"],
+                condition=~models.Q(vin=""),
+                name="car_vin_nonempty_idx",
+            ),
         ]
 
     def __str__(self) -> str:
+        if self.make_title and self.model_title:
+            return f"{self.make_title} {self.model_title} ({self.manufacture_year})"
         return f"{self.make.title} {self.model.title} ({self.manufacture_year})"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Loaded-state snapshot for the dirty check in save(); stays None
+        # when the column was deferred (__dict__ lookup avoids triggering
+        # a deferred-field fetch).
+        self._original_status = self.__dict__.get("status")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._original_status = instance.__dict__.get("status")
+        return instance
+
     def save(self, *args, **kwargs):
+        # Fields assigned inside this method; merged into a caller-supplied
+        # update_fields so a narrow UPDATE still persists them.
+        computed_fields = set()
+
+        # One clock read per save: every timestamp set below carries the
+        # same instant.
+        now = timezone.now()
+
         if not self.slug:
-            make_slug = self.make.slug or slugify(self.make.title)
-            model_slug = self.model.slug or slugify(self.model.title)
-            slug_source = f"{make_slug}-{model_slug}-{self.vin or self.pk or ''}"
-            self.slug = slugify(slug_source)
+            # Make/CarModel slugs are guaranteed non-empty by their own
+            # save(), so no slugify() pass over the titles is needed here.
+            make_slug = self.make.slug
+            model_slug = self.model.slug
+            # A VIN keeps the slug deterministic; without one a random
+            # suffix makes two otherwise identical cars collide on the
+            # unique index with ~zero probability, so no pre-save
+            # existence check or retry loop is needed.
+            suffix = self.vin or secrets.token_urlsafe(6)
+            self.slug = slugify(f"{make_slug}-{model_slug}-{suffix}")
+            computed_fields.add("slug")
 
         if self.status == self.Status.PUBLISHED and not self.published_at:
-            self.published_at = timezone.now()
-
-        update_fields = kwargs.get("update_fields") or []
-        status_was_changed = False
+            self.published_at = now
+            computed_fields.add("published_at")
+
+        # Keep the denormalised display titles in sync with the FK targets
+        # so __str__ and log formatting never need a JOIN. Already-cached
+        # relations are used as-is; a fetch happens only for legacy rows
+        # whose titles were never populated.
+        make = self._state.fields_cache.get("make")
+        if make is None and not self.make_title and self.make_id:
+            make = self.make
+        if make is not None and make.title != self.make_title:
+            self.make_title = make.title
+            computed_fields.add("make_title")
+
+        model = self._state.fields_cache.get("model")
+        if model is None and not self.model_title and self.model_id:
+            model = self.model
+        if model is not None and model.title != self.model_title:
+            self.model_title = model.title
+            computed_fields.add("model_title")
+
+        update_fields = kwargs.get("update_fields")
 
         if update_fields:
             status_was_changed = "status" in update_fields
+        elif self.pk is None:
+            status_was_changed = True
         else:
-            if self.pk is None:
-                status_was_changed = True
-            else:
-                previous_status = (
+            original_status = self._original_status
+            if original_status is None:
+                # Rare uncached path (deferred load); fall back to a
+                # single-column SELECT on the database this instance came
+                # from, so the read never bounces to a replica that may
+                # not have the row yet. _base_manager skips the default
+                # select_related JOINs.
+                original_status = (
                     self.__class__
-                    .objects.filter(pk=self.pk)
+                    ._base_manager.using(self._state.db or "default")
+                    .filter(pk=self.pk)
                     .values_list("status", flat=True)
                     .first()
                 )
-                status_was_changed = previous_status is not None and previous_status != self.status
+            status_was_changed = original_status is not None and original_status != self.status
 
         if status_was_changed:
-            self.status_changed_at = timezone.now()
+            self.status_changed_at = now
+            computed_fields.add("status_changed_at")
+
+        if update_fields and computed_fields:
+            kwargs["update_fields"] = tuple(set(update_fields) | computed_fields)
 
         super().save(*args, **kwargs)
+        self._original_status = self.status
 
-            self.slug = slugify(f"{make_slug}-{model_slug}-{self.vin or self.pk or ''}")
-            models.Index(fields=["brand", "model_name"]),
-        ]
 
-    def __str__(self) -> str:
-        return f"{self.brand} {self.model_name} ({self.manufacture_year})"
+class CarFeature(models.Model):
+    """Explicit through table for :attr:`Car.features`.
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.brand}-{self.model_name}-{self.vin or self.pk or ''}")
-        if self.status == self.Status.PUBLISHED and not self.published_at:
-            self.published_at = timezone.now()
-        if "update_fields" in kwargs and kwargs["update_fields"]:
-            if "status" in kwargs["update_fields"]:
-                self.status_changed_at = timezone.now()
-        elif self.pk is None or "status" in self.get_dirty_fields():
-            self.status_changed_at = timezone.now()
-        super().save(*args, **kwargs)
+    Mirrors the table Django auto-created for the M2M (same name and
+    columns, so existing rows are preserved) but adds a (feature, car)
+    index: "features of a car" was already covered by the unique pair,
+    while "cars with this feature" needed a full scan.
+    """
 
-    def get_dirty_fields(self) -> set[str]:
-        if not self.pk:
-            return {"status"}
-        old = Car.objects.get(pk=self.pk)
-        changed = set()
-        for field in ["status"]:
-            if getattr(old, field) != getattr(self, field):
-                changed.add(field)
-        return changed
+    car = models.ForeignKey(
+        Car, on_delete=models.CASCADE, verbose_name="Автомобиль"
+    )
+    feature = models.ForeignKey(
+        Feature, on_delete=models.CASCADE, verbose_name="Особенность"
+    )
+
+    class Meta:
+        db_table = "inventory_car_features"
+        unique_together = [("car", "feature")]
+        indexes = [
+            models.Index(fields=["feature", "car"], name="carfeat_feature_car_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.car_id} – {self.feature_id}"
 
 
 class CarImage(TimestampedModel):
@@ -273,31 +429,99 @@ class CarImage(TimestampedModel):
     caption = models.CharField("Подпись", max_length=150, blank=True)
     is_primary = models.BooleanField("Основное фото", default=False)
     ordering = models.PositiveSmallIntegerField("Порядок", default=0)
+    optimised = models.BooleanField("Оптимизировано", default=False, editable=False)
 
     class Meta:
         verbose_name = "Фото автомобиля"
         verbose_name_plural = "Фотографии автомобилей"
         ordering = ["ordering", "id"]
+        indexes = [
+            models.Index(
+                fields=["car", "ordering", "id"], name="carimg_gallery_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["car"],
+                condition=models.Q(is_primary=True),
+                name="uniq_primary_car_image",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Фото {self.car}"
 
-    def save(self, *args, **kwargs):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The stored value; False for unsaved rows even if the instance is
+        # constructed with is_primary=True.
+        self._original_is_primary = False
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._original_is_primary = instance.__dict__.get("is_primary", False)
+        return instance
+
+    def optimise_pending_upload(self) -> bool:
+        """Replace a not-yet-committed upload with its optimised JPEG variant.
+
+        Exposed separately from :meth:`save` so bulk ingestion paths that
+        bypass per-row saves can still run the optimisation pipeline.
+        Returns whether a replacement actually happened.
+
+        Source bytes are read exactly once — in-memory uploads through the
+        file object, disk-spooled ones straight from the temp path — and
+        the ``FieldFile.save(..., save=False)`` below is the only disk
+        write: it stores the optimised payload and flips ``_committed`` to
+        True, so the original upload is never written and a repeated
+        ``save()`` on this instance skips the pipeline.
+        """
+
         if self.image and not getattr(self.image, "_committed", False):
             file_obj = getattr(self.image, "file", self.image)
-            name, optimised_file = optimise_car_image(file_obj)
+            # Large uploads are spooled to disk; hand over the path so the
+            # bytes are read once at the C level rather than through the
+            # upload wrapper.
+            temporary_file_path = getattr(file_obj, "temporary_file_path", None)
+            if temporary_file_path is not None:
+                name, optimised_file = optimise_car_image(
+                    temporary_file_path(), original_name=self.image.name
+                )
+            else:
+                name, optimised_file = optimise_car_image(file_obj)
             self.image.save(name, optimised_file, save=False)
+            self.optimised = True
+            return True
+        return False
 
-        super().save(*args, **kwargs)
+    def save(self, *args, **kwargs):
+        if getattr(settings, "CAR_IMAGE_ASYNC_OPTIMISE", False):
+            # Store the raw upload as-is and return to the caller; the
+            # optimised variant is produced off the request thread (see
+            # ``inventory.tasks``, queued from the post_save signal).
+            image_was_replaced = False
+        else:
+            image_was_replaced = self.optimise_pending_upload()
 
-        if self.is_primary:
-            (
-                self.__class__
-                .objects.filter(car=self.car, is_primary=True)
-                .exclude(pk=self.pk)
-                .update(is_primary=False)
+        update_fields = kwargs.get("update_fields")
+        if update_fields and image_was_replaced:
+            kwargs["update_fields"] = tuple(
+                set(update_fields) | {"image", "optimised"}
             )
 
+        # Clear competing primaries only when this image actually became
+        # primary, and before our own write so the partial unique
+        # constraint never sees two primaries per car.
+        if self.is_primary and not self._original_is_primary:
+            others = self.__class__.objects.filter(car_id=self.car_id, is_primary=True)
+            if self.pk:
+                others = others.exclude(pk=self.pk)
+            others.update(is_primary=False)
+
+        super().save(*args, **kwargs)
+        self._original_is_primary = self.is_primary
+
 
 class PublicationChannel(models.Model):
     """Platform where a car can be published."""
@@ -321,6 +545,17 @@ class PublicationChannel(models.Model):
         return self.title
 
 
+class PublicationLogManager(models.Manager):
+    def get_queryset(self):
+        # __str__ renders the car and channel, so any loop over logs
+        # without these JOINs turns into per-row lookups.
+        return (
+            super()
+            .get_queryset()
+            .select_related("car__make", "car__model", "channel")
+        )
+
+
 class PublicationLog(TimestampedModel):
     """Stores history of publications to external channels."""
 
@@ -359,12 +594,22 @@ class PublicationLog(TimestampedModel):
         blank=True,
     )
 
+    objects = PublicationLogManager()
+
     class Meta:
         verbose_name = "Лог публикации"
         verbose_name_plural = "Логи публикаций"
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["channel", "status"]),
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(
+                fields=["channel", "status", "-created_at"],
+                name="publog_chan_status_created_idx",
+            ),
+            models.Index(
+                fields=["car", "-created_at"], name="publog_car_created_idx"
+            ),
         ]
 
     def __str__(self) -> str:
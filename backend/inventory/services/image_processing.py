@@ -1,17 +1,158 @@
 """Utilities for normalising and optimising uploaded vehicle images."""
 from __future__ import annotations
 
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from PIL import Image, ImageOps
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 
+try:
+    import pyvips
+except ImportError:  # pragma: no cover - optional streaming decoder
+    pyvips = None
+
 MAX_IMAGE_SIZE = (2560, 2560)
 JPEG_QUALITY = 85
 
+#: Where optimised payloads are kept for content-hash reuse, relative to
+#: ``MEDIA_ROOT``.
+OPTIMISED_CACHE_DIR = "cars/_cache"
+
+
+def _optimised_cache_path(digest: str) -> Path:
+    return Path(settings.MEDIA_ROOT) / OPTIMISED_CACHE_DIR / f"{digest}.jpg"
+
+
+def _load_cached_optimised(digest: str) -> bytes | None:
+    """Return a previously optimised payload for ``digest``, if any.
+
+    The path is fully derived from the digest, so the file itself is the
+    cache: no pointer to expire, and clearing the directory is the only
+    eviction needed.
+    """
+
+    try:
+        return _optimised_cache_path(digest).read_bytes()
+    except OSError:
+        return None
+
+
+def _store_cached_optimised(digest: str, encoded: bytes) -> None:
+    target = _optimised_cache_path(digest)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    except OSError:
+        # Best-effort cache; the caller still has the encoded payload.
+        return
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(encoded)
+        # os.replace is atomic within a directory, so a concurrent reader
+        # of the same digest sees either nothing or a complete file —
+        # never a partially written payload.
+        os.replace(tmp_name, target)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def _is_web_ready_jpeg(data: bytes) -> bool:
+    """Whether the upload can be stored verbatim.
+
+    Inspects only the header — no pixel decode: a JPEG already within the
+    size cap, in a web-safe mode, with no EXIF orientation to apply,
+    gains nothing from a decode/resample/encode cycle.
+    """
+
+    try:
+        with Image.open(BytesIO(data)) as image:
+            return (
+                image.format == "JPEG"
+                and max(image.size) <= MAX_IMAGE_SIZE[0]
+                and image.mode in ("RGB", "L")
+                and image.getexif().get(0x0112, 1) in (None, 1)
+            )
+    except OSError:
+        # Not a readable image; let the full pipeline raise properly.
+        return False
+
+
+def _optimise_with_vips(data: bytes) -> bytes:
+    """Resize and re-encode with libvips.
+
+    ``thumbnail_buffer`` streams the decode sequentially, uses JPEG
+    shrink-on-load and applies EXIF orientation, so a 12 MP upload never
+    materialises as a full bitmap in memory the way the PIL path does.
+    ``size="down"`` matches ``Image.thumbnail``'s no-upscale behaviour.
+    """
+
+    image = pyvips.Image.thumbnail_buffer(
+        data, MAX_IMAGE_SIZE[0], height=MAX_IMAGE_SIZE[1], size="down"
+    )
+    if image.hasalpha():
+        image = image.flatten(background=[255, 255, 255])
+    return image.jpegsave_buffer(
+        Q=JPEG_QUALITY,
+        strip=True,
+        interlace=True,
+        trellis_quant=True,
+        overshoot_deringing=True,
+    )
+
+
+def _optimise_with_pil(data: bytes) -> bytes:
+    """Resize and re-encode with Pillow (fallback when pyvips is absent).
+
+    This path is memory-bound: the decoded bitmap dwarfs the CPU cost of
+    resampling, so the encoded result is handed back via ``getvalue()``
+    (one copy) rather than ``seek(0)``/``read()``, which would duplicate
+    the buffer a second time inside ``ContentFile``.
+    """
+
+    image = Image.open(BytesIO(data))
+
+    # JPEG sources can decode straight to a fraction of full size via
+    # libjpeg's scale-denom (a no-op for other formats).
+    image.draft("RGB", MAX_IMAGE_SIZE)
+
+    # Apply orientation and convert for uniform encoding
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    # Integer box downscale first, so the expensive LANCZOS resample only
+    # ever sees an image less than twice the target size.
+    scale = max(image.size) // MAX_IMAGE_SIZE[0]
+    if scale > 1:
+        image = image.reduce(scale)
 
-def optimise_car_image(file_obj) -> tuple[str, ContentFile]:
+    image.thumbnail(MAX_IMAGE_SIZE, Image.Resampling.LANCZOS)
+
+    buffer = BytesIO()
+    # No optimize=True: the extra Huffman pass costs ~30% encode time for
+    # a few percent smaller files. Progressive + 4:2:0 keeps the payload
+    # web-friendly without it.
+    image.save(
+        buffer,
+        format="JPEG",
+        quality=JPEG_QUALITY,
+        progressive=True,
+        subsampling="4:2:0",
+    )
+    image.close()
+    return buffer.getvalue()
+
+
+def optimise_car_image(source, original_name: str | None = None) -> tuple[str, ContentFile]:
     """Return an optimised JPEG version of the uploaded file.
 
     The function performs the following adjustments:
@@ -21,11 +162,27 @@ def optimise_car_image(file_obj) -> tuple[str, ContentFile]:
       keeping enough resolution for marketplaces;
     * converts the picture to RGB and stores it as a high-quality JPEG.
 
+    When pyvips is installed the work is done by libvips in a streaming
+    pipeline (several times faster and far lighter on memory for large
+    uploads); otherwise the original PIL implementation is used.
+
+    Results are content-addressed: the upload's bytes are hashed and the
+    encoded payload is kept under ``MEDIA_ROOT/cars/_cache``, so re-saving
+    the same underlying file (common with admin edits that re-touch the
+    field) skips the decode/resize/encode cycle entirely.
+
     Parameters
     ----------
-    file_obj:
+    source:
         An instance of ``File`` or ``InMemoryUploadedFile`` coming from
-        ``ImageField``.
+        ``ImageField``, or a filesystem path. Uploads that already sit on
+        disk (``TemporaryUploadedFile``) should be passed by path: the
+        bytes then arrive through one C-level read instead of funnelling
+        through Django's Python file wrapper.
+    original_name:
+        Name used for the resulting ``.jpg``; defaults to the source's own
+        name, which for a temp-file path would be the meaningless random
+        temp name.
 
     Returns
     -------
@@ -33,24 +190,85 @@ def optimise_car_image(file_obj) -> tuple[str, ContentFile]:
         Filename (with .jpg extension) and the in-memory optimised payload.
     """
 
-    original_name = getattr(file_obj, "name", "car-image")
+    if isinstance(source, (str, Path)):
+        source = Path(source)
+        if original_name is None:
+            original_name = source.name
+        data = source.read_bytes()
+    else:
+        if original_name is None:
+            original_name = getattr(source, "name", "car-image")
+        source.seek(0)
+        data = source.read()
+
     base_name = Path(original_name).stem
+    optimised_name = f"{base_name}.jpg"
 
-    file_obj.seek(0)
-    image = Image.open(file_obj)
+    # Compliant uploads skip the pipeline (and the content-hash cache)
+    # entirely.
+    if _is_web_ready_jpeg(data):
+        return optimised_name, ContentFile(data, name=optimised_name)
 
-    # Apply orientation and convert for uniform encoding
-    image = ImageOps.exif_transpose(image)
-    if image.mode not in ("RGB", "L"):
-        image = image.convert("RGB")
+    # BLAKE2 over the raw upload; fast, and nothing here needs the
+    # collision guarantees of a password-grade hash.
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    encoded = _load_cached_optimised(digest)
 
-    image.thumbnail(MAX_IMAGE_SIZE, Image.Resampling.LANCZOS)
+    if encoded is None:
+        if pyvips is not None:
+            encoded = _optimise_with_vips(data)
+        else:
+            encoded = _optimise_with_pil(data)
+        _store_cached_optimised(digest, encoded)
 
-    buffer = BytesIO()
-    image.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
-    image.close()
-    buffer.seek(0)
+    return optimised_name, ContentFile(encoded, name=optimised_name)
 
-    optimised_name = f"{base_name}.jpg"
-    return optimised_name, ContentFile(buffer.read(), name=optimised_name)
 
+_worker_pool: ProcessPoolExecutor | None = None
+
+
+def _get_worker_pool() -> ProcessPoolExecutor:
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _worker_pool
+
+
+def _encode_worker(name: str, data: bytes) -> tuple[str, bytes]:
+    """Per-process unit of work; takes and returns picklable values only.
+
+    Runs the same decision chain as :func:`optimise_car_image` but skips
+    the content-hash cache so workers never touch Django's cache or
+    storage layers.
+    """
+
+    if _is_web_ready_jpeg(data):
+        return name, data
+    if pyvips is not None:
+        return name, _optimise_with_vips(data)
+    return name, _optimise_with_pil(data)
+
+
+def optimise_many(files) -> list[tuple[str, ContentFile]]:
+    """Optimise a batch of uploads across a process pool.
+
+    Gallery ingestion (admin multi-upload, future bulk API endpoints)
+    would otherwise encode photos one after another on the request
+    thread. The pool is module-level and lazily created, so the fork
+    cost is paid once per worker process, and results come back in
+    input order.
+    """
+
+    names: list[str] = []
+    payloads: list[bytes] = []
+    for file_obj in files:
+        original_name = getattr(file_obj, "name", "car-image")
+        names.append(f"{Path(original_name).stem}.jpg")
+        file_obj.seek(0)
+        payloads.append(file_obj.read())
+
+    pool = _get_worker_pool()
+    return [
+        (name, ContentFile(encoded, name=name))
+        for name, encoded in pool.map(_encode_worker, names, payloads)
+    ]
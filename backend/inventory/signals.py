@@ -0,0 +1,46 @@
+"""Cache invalidation and task-queueing hooks for inventory models."""
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import models
+
+#: Cached set of existing Feature ids used for write-path PK validation.
+FEATURE_IDS_CACHE_KEY = "inventory:feature-ids"
+
+
+@receiver(post_save, sender=models.Feature)
+@receiver(post_delete, sender=models.Feature)
+def invalidate_feature_ids(sender, **kwargs) -> None:
+    cache.delete(FEATURE_IDS_CACHE_KEY)
+
+
+@receiver(post_save, sender=models.CarImage)
+def queue_image_optimisation(sender, instance, **kwargs) -> None:
+    """Hand raw uploads to the background optimiser when it is enabled.
+
+    The task swaps the file via ``QuerySet.update()``, so this receiver
+    never fires again for the finished row.
+    """
+
+    if not getattr(settings, "CAR_IMAGE_ASYNC_OPTIMISE", False):
+        return
+    if instance.optimised or not instance.image:
+        return
+
+    from . import tasks
+
+    if tasks.optimise_stored_car_image_task is not None:
+        transaction.on_commit(
+            lambda: tasks.optimise_stored_car_image_task.delay(instance.pk)
+        )
+    else:
+        # Celery is not installed; degrade to inline processing after the
+        # transaction lands so the row the task reads is visible.
+        transaction.on_commit(
+            lambda: tasks.optimise_stored_car_image(instance.pk)
+        )
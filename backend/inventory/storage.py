@@ -0,0 +1,108 @@
+"""Custom storage backends for the inventory media pipeline."""
+from __future__ import annotations
+
+import functools
+import os
+import threading
+
+import boto3
+import botocore.config
+from django.core.exceptions import ImproperlyConfigured
+from storages.backends.s3boto3 import S3Boto3Storage
+
+
+@functools.lru_cache(maxsize=1)
+def s3_storage_options() -> dict:
+    """Resolve the S3 backend options from the environment, once.
+
+    Called on first storage instantiation rather than at settings import,
+    so management commands that never touch media (``migrate``,
+    ``collectstatic`` to local disk) skip the whole block.
+    """
+
+    bucket_name = os.getenv("AWS_STORAGE_BUCKET_NAME")
+    if not bucket_name:
+        raise ImproperlyConfigured(
+            "AWS_STORAGE_BUCKET_NAME must be set when DJANGO_USE_S3_MEDIA=1"
+        )
+    return {
+        "bucket_name": bucket_name,
+        "region_name": os.getenv("AWS_S3_REGION_NAME"),
+        "endpoint_url": os.getenv("AWS_S3_ENDPOINT_URL"),
+        "custom_domain": os.getenv("AWS_S3_CUSTOM_DOMAIN"),
+        "access_key": os.getenv("AWS_ACCESS_KEY_ID"),
+        "secret_key": os.getenv("AWS_SECRET_ACCESS_KEY"),
+        "default_acl": None,
+        "querystring_auth": False,
+        "file_overwrite": False,
+        "signature_version": os.getenv("AWS_S3_SIGNATURE_VERSION", "s3v4"),
+    }
+
+
+_thread_cache = threading.local()
+
+
+def _shared_resource(
+    access_key: str | None,
+    secret_key: str | None,
+    region: str | None,
+    endpoint_url: str | None,
+):
+    """One S3 resource per (credentials, endpoint) per thread.
+
+    boto3 Sessions and Resources are not thread-safe, so the reuse is
+    scoped to the current thread — that still amortises session
+    construction and the SSL handshake across all storage instances a
+    thread creates, which is what the per-instance caching in
+    ``S3Boto3Storage`` failed to do.
+    """
+
+    resources = getattr(_thread_cache, "resources", None)
+    if resources is None:
+        resources = _thread_cache.resources = {}
+
+    key = (access_key, secret_key, region, endpoint_url)
+    resource = resources.get(key)
+    if resource is None:
+        session = boto3.session.Session(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+        )
+        resource = resources[key] = session.resource(
+            "s3",
+            endpoint_url=endpoint_url,
+            config=botocore.config.Config(
+                max_pool_connections=50,
+                retries={"max_attempts": 3, "mode": "standard"},
+            ),
+        )
+    return resource
+
+
+class CachedS3Storage(S3Boto3Storage):
+    """S3 storage that reuses one boto3 session and connection per thread.
+
+    ``S3Boto3Storage`` keeps its connection in a ``threading.local`` per
+    storage instance, so every freshly constructed storage pays session
+    construction and an SSL handshake before the first signed URL can be
+    produced. Serving ``CarImageSerializer`` responses instantiates
+    storages often enough for that to dominate URL generation, so the
+    connection is cached at module level instead — per thread, because
+    boto3 resources are not thread-safe.
+
+    Backend options default to :func:`s3_storage_options`; keyword
+    arguments (e.g. from ``STORAGES`` ``OPTIONS``) still win.
+    """
+
+    def __init__(self, **settings):
+        super().__init__(**{**s3_storage_options(), **settings})
+
+    @property
+    def connection(self):
+        return _shared_resource(
+            self.access_key,
+            self.secret_key,
+            self.region_name,
+            self.endpoint_url,
+        )
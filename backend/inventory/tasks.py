@@ -0,0 +1,50 @@
+"""Background tasks for the inventory app.
+
+Celery is optional: when it is not installed the task callables below are
+still importable as plain functions, and the signal that queues them falls
+back to running the work inline after commit.
+"""
+from __future__ import annotations
+
+from . import models
+from .services.image_processing import optimise_car_image
+
+try:
+    from celery import shared_task
+except ImportError:  # pragma: no cover - optional task queue
+    shared_task = None
+
+
+def optimise_stored_car_image(image_pk: int) -> None:
+    """Produce the optimised variant for a raw upload stored earlier.
+
+    The row is updated via ``QuerySet.update()`` rather than ``save()`` so
+    the swap bypasses signals and cannot re-queue itself.
+    """
+
+    image = models.CarImage.objects.filter(pk=image_pk).first()
+    if image is None or image.optimised or not image.image:
+        return
+
+    name, optimised_file = optimise_car_image(image.image.file)
+    old_name = image.image.name
+    storage = image.image.storage
+    stored_name = storage.save(
+        image.image.field.generate_filename(image, name), optimised_file
+    )
+    models.CarImage.objects.filter(pk=image_pk).update(
+        image=stored_name, optimised=True
+    )
+    # The raw upload is unreferenced once the row points at the optimised
+    # variant; drop it so every async-optimised image doesn't leave its
+    # full-size original behind.
+    if old_name and old_name != stored_name:
+        storage.delete(old_name)
+
+
+if shared_task is not None:
+    optimise_stored_car_image_task = shared_task(
+        name="inventory.optimise_stored_car_image", ignore_result=True
+    )(optimise_stored_car_image)
+else:
+    optimise_stored_car_image_task = None
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+
+from inventory import models
+from inventory.api.serializers import CarSerializer
+
+from .test_models import create_make_and_model, generate_test_image
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+def create_car(make: models.Make, model: models.CarModel, **overrides) -> models.Car:
+    defaults = {
+        "title": f"{make.title} {model.title}",
+        "make": make,
+        "model": model,
+        "manufacture_year": 2021,
+        "price": 40000,
+        "currency": "USD",
+        "mileage_km": 20000,
+        "contact_name": "Manager",
+        "contact_phone": "+375291112233",
+    }
+    defaults.update(overrides)
+    return models.Car.objects.create(**defaults)
+
+
+def test_car_list_serializes_image_rows(db, settings, tmp_path, api_client):
+    settings.MEDIA_ROOT = tmp_path
+
+    make, model = create_make_and_model("Audi", "A6")
+    car = create_car(make, model)
+    models.CarImage.objects.create(
+        car=car,
+        image=SimpleUploadedFile("front.jpg", generate_test_image(1200, 800)),
+        caption="Вид спереди",
+        is_primary=True,
+    )
+
+    response = api_client.get("/api/cars/")
+
+    assert response.status_code == 200
+    row = response.json()["results"][0]["images"][0]
+    assert row["caption"] == "Вид спереди"
+    assert row["is_primary"] is True
+    assert row["image"].startswith("http")
+
+
+def test_car_image_sync_updates_rows_in_place(db, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+    make, model = create_make_and_model("Audi", "Q5")
+    car = create_car(make, model)
+    image = models.CarImage.objects.create(
+        car=car,
+        image=SimpleUploadedFile("front.jpg", generate_test_image(1200, 800)),
+        caption="Старая подпись",
+    )
+
+    serializer = CarSerializer()
+    validated = serializer.fields["images"].to_internal_value(
+        [
+            {
+                "id": image.pk,
+                "image": SimpleUploadedFile("front.jpg", generate_test_image(1200, 800)),
+                "caption": "Новая подпись",
+            }
+        ]
+    )
+    serializer._sync_images(car, validated)
+
+    image.refresh_from_db()
+    assert car.images.count() == 1
+    assert image.caption == "Новая подпись"
+
+
+def test_car_create_accepts_feature_and_model_ids(db, api_client):
+    make, model = create_make_and_model("BMW", "M3")
+    category = models.FeatureCategory.objects.create(title="Комфорт", slug="comfort")
+    feature = models.Feature.objects.create(
+        title="Подогрев сидений", slug="heated-seats", category=category
+    )
+
+    response = api_client.post(
+        "/api/cars/",
+        {
+            "title": "BMW M3",
+            "make_id": make.id,
+            "model_id": model.id,
+            "manufacture_year": 2022,
+            "price": 60000,
+            "currency": "USD",
+            "mileage_km": 100,
+            "contact_name": "Manager",
+            "contact_phone": "+375291112233",
+            "features": [feature.id],
+        },
+        format="json",
+    )
+
+    assert response.status_code == 201, response.content
+    car = models.Car.objects.get(pk=response.json()["id"])
+    assert list(car.features.values_list("id", flat=True)) == [feature.id]
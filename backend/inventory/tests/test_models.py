@@ -6,8 +6,6 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
 from django.utils.text import slugify
 from PIL import Image
-from PIL import Image
-from django.utils import timezone
 
 from inventory import models
 
@@ -28,11 +26,6 @@ def test_car_status_timestamp_updates(db):
         title="Test Car",
         make=make,
         model=model,
-def test_car_status_timestamp_updates(db):
-    car = models.Car.objects.create(
-        title="Test Car",
-        brand="Audi",
-        model_name="A4",
         manufacture_year=2020,
         price=25000,
         currency="USD",
@@ -58,10 +51,6 @@ def test_publication_log_str(db):
         title="Test Car",
         make=make,
         model=model,
-    car = models.Car.objects.create(
-        title="Test Car",
-        brand="BMW",
-        model_name="X5",
         manufacture_year=2019,
         price=30000,
         currency="USD",
@@ -75,6 +64,41 @@ def test_publication_log_str(db):
     assert str(log) == f"В обработке – {car} в {channel}"
 
 
+def test_bulk_import_prefills_computed_fields(db):
+    make, model = create_make_and_model("Kia", "Sportage")
+    cars = models.Car.objects.bulk_import(
+        models.Car(
+            title=f"Imported Car {index}",
+            make=make,
+            model=model,
+            vin=f"VIN{index:05d}",
+            manufacture_year=2018,
+            price=18000,
+            currency="USD",
+            mileage_km=60000,
+            contact_name="Manager",
+            contact_phone="+375291112233",
+            status=models.Car.Status.PUBLISHED,
+        )
+        for index in range(3)
+    )
+
+    assert len(cars) == 3
+    for car in cars:
+        assert car.slug
+        assert car.published_at is not None
+        assert car.make_title == "Kia"
+        assert car.model_title == "Sportage"
+
+    updated = models.Car.objects.filter(make=make).set_status(
+        models.Car.Status.ARCHIVED
+    )
+    assert updated == 3
+    assert not models.Car.objects.exclude(
+        status=models.Car.Status.ARCHIVED
+    ).exists()
+
+
 def generate_test_image(width=4000, height=3000, color=(255, 0, 0), image_format="JPEG") -> bytes:
     buffer = BytesIO()
     image = Image.new("RGB", (width, height), color)
@@ -91,10 +115,6 @@ def test_car_image_is_optimised_on_save(db, settings, tmp_path):
         title="Optimised Car",
         make=make,
         model=model,
-    car = models.Car.objects.create(
-        title="Optimised Car",
-        brand="Audi",
-        model_name="Q7",
         manufacture_year=2021,
         price=50000,
         currency="USD",
@@ -127,10 +147,6 @@ def test_only_single_primary_image_is_kept(db, settings, tmp_path):
         title="Primary Car",
         make=make,
         model=model,
-    car = models.Car.objects.create(
-        title="Primary Car",
-        brand="Tesla",
-        model_name="Model S",
         manufacture_year=2022,
         price=90000,
         currency="USD",